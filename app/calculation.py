@@ -6,12 +6,14 @@ from dataclasses import dataclass, field
 import datetime
 from decimal import Decimal, InvalidOperation
 import logging
-from typing import Any, Dict
+import sys
+from typing import Any, Callable, ClassVar, Dict, Optional
 
 from app.exceptions import OperationError
+from app.operations import decimal_power
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Calculation:
     """
     Value Object representing a single calculation.
@@ -20,6 +22,9 @@ class Calculation:
     operation performed, operands involved, the result, and the timestamp of the
     calculation. It provides methods for performing the calculation, serializing
     the data for storage, and deserializing data to recreate a Calculation instance.
+
+    Instances are immutable, which allows the serialized form to be cached and
+    lets history snapshots share Calculation objects safely.
     """
 
     # Required fields
@@ -28,25 +33,60 @@ class Calculation:
     operand2: Decimal       # The second operand in the calculation
 
     # Fields with default values
-    result: Decimal = field(init=False)  # The result of the calculation, computed post-initialization
+    result: Optional[Decimal] = field(default=None, kw_only=True)  # The result of the calculation, computed post-initialization if not given
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the calculation was performed
 
+    # Serialized form, built on the first call to to_dict
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    # Mapping of operation names to their corresponding functions, built once
+    # for the class rather than on every calculation
+    _OPERATIONS: ClassVar[Dict[str, Callable[[Decimal, Decimal], Decimal]]] = {
+        "Addition": lambda x, y: x + y,
+        "Subtraction": lambda x, y: x - y,
+        "Multiplication": lambda x, y: x * y,
+        "Division": lambda x, y: x / y if y != 0 else Calculation._raise_div_zero(),
+        "Power": lambda x, y: decimal_power(x, y) if y >= 0 else Calculation._raise_neg_power(),
+        "Root": lambda x, y: (
+            Decimal(pow(float(x), 1 / float(y))) 
+            if x >= 0 and y != 0 
+            else Calculation._raise_invalid_root(x, y)
+        ),
+        "IntegerDivision": lambda x, y: Decimal(int(x // y)) if y != 0 else Calculation._raise_div_zero(),
+        "Percentage": lambda x, y: (x / y * 100) if y != 0 else Calculation._raise_div_zero(),
+        "AbsoluteDifference": lambda x, y: abs(x - y),
+        "Modulus": lambda x, y: x % y if y != 0 else Calculation._raise_div_zero()
+    }
+
     def __post_init__(self):
         """
         Post-initialization processing.
 
         Automatically calculates the result of the operation after the Calculation
-        instance is created.
+        instance is created, unless a precomputed result was supplied (as the
+        Calculator does with its memoized results). A supplied result is only
+        accepted for known operations, so every stored calculation can be
+        reloaded from a history file. The operation name is interned so that
+        names loaded from history files share a single string object. The
+        instance is frozen, so attributes are assigned through object.__setattr__.
+
+        Raises:
+            OperationError: If a result is supplied for an unknown operation.
         """
-        self.result = self.calculate()
+        if isinstance(self.operation, str):
+            object.__setattr__(self, 'operation', sys.intern(self.operation))
+        if self.result is None:
+            object.__setattr__(self, 'result', self.calculate())
+        elif self.operation not in self._OPERATIONS:
+            raise OperationError(f"Unknown operation: {self.operation}")
 
     def calculate(self) -> Decimal:
         """
         Execute calculation using the specified operation.
 
-        Utilizes a dictionary to map operation names to their corresponding
-        lambda functions, enabling dynamic execution of operations based on
-        the operation name.
+        Utilizes the class-level _OPERATIONS dictionary to map operation names
+        to their corresponding lambda functions, enabling dynamic execution of
+        operations based on the operation name.
 
         Returns:
             Decimal: The result of the calculation.
@@ -54,26 +94,8 @@ class Calculation:
         Raises:
             OperationError: If the operation is unknown or the calculation fails.
         """
-        # Mapping of operation names to their corresponding functions
-        operations = {
-            "Addition": lambda x, y: x + y,
-            "Subtraction": lambda x, y: x - y,
-            "Multiplication": lambda x, y: x * y,
-            "Division": lambda x, y: x / y if y != 0 else self._raise_div_zero(),
-            "Power": lambda x, y: Decimal(pow(float(x), float(y))) if y >= 0 else self._raise_neg_power(),
-            "Root": lambda x, y: (
-                Decimal(pow(float(x), 1 / float(y))) 
-                if x >= 0 and y != 0 
-                else self._raise_invalid_root(x, y)
-            ),
-            "IntegerDivision": lambda x, y: Decimal(int(x // y)) if y != 0 else self._raise_div_zero(),
-            "Percentage": lambda x, y: (x / y * 100) if y != 0 else self._raise_div_zero(),
-            "AbsoluteDifference": lambda x, y: abs(x - y),
-            "Modulus": lambda x, y: x % y if y != 0 else self._raise_div_zero()
-        }
-
         # Retrieve the operation function based on the operation name
-        op = operations.get(self.operation)
+        op = self._OPERATIONS.get(self.operation)
         if not op:
             raise OperationError(f"Unknown operation: {self.operation}")
 
@@ -125,18 +147,22 @@ class Calculation:
         Convert calculation to dictionary for serialization.
 
         This method transforms the Calculation instance into a dictionary format,
-        facilitating easy storage and retrieval (e.g., saving to a file).
+        facilitating easy storage and retrieval (e.g., saving to a file). The
+        serialized values are computed once and cached, since the instance is
+        immutable; each call returns a fresh copy of the cached dictionary.
 
         Returns:
             Dict[str, Any]: A dictionary containing the calculation data in a serializable format.
         """
-        return {
-            'operation': self.operation,
-            'operand1': str(self.operand1),
-            'operand2': str(self.operand2),
-            'result': str(self.result),
-            'timestamp': self.timestamp.isoformat()
-        }
+        if self._dict_cache is None:
+            object.__setattr__(self, '_dict_cache', {
+                'operation': self.operation,
+                'operand1': str(self.operand1),
+                'operand2': str(self.operand2),
+                'result': str(self.result),
+                'timestamp': self.timestamp.isoformat()
+            })
+        return dict(self._dict_cache)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Calculation':
@@ -156,16 +182,14 @@ class Calculation:
             OperationError: If data is invalid or missing required fields.
         """
         try:
-            # Create the calculation object with the original operands
+            # Create the calculation object with the original operands and timestamp
             calc = Calculation(
                 operation=data['operation'],
                 operand1=Decimal(data['operand1']),
-                operand2=Decimal(data['operand2'])
+                operand2=Decimal(data['operand2']),
+                timestamp=datetime.datetime.fromisoformat(data['timestamp'])
             )
 
-            # Set the timestamp from the saved data
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
-
             # Verify the result matches (helps catch data corruption)
             saved_result = Decimal(data['result'])
             if calc.result != saved_result:
@@ -231,6 +255,15 @@ class Calculation:
             self.result == other.result
         )
 
+    def __hash__(self) -> int:
+        """
+        Return a hash consistent with __eq__.
+
+        Returns:
+            int: Hash of the operation, operands, and result.
+        """
+        return hash((self.operation, self.operand1, self.operand2, self.result))
+
     def format_result(self, precision: int = 10) -> str:
         """
         Format the calculation result with specified precision.
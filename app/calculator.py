@@ -2,13 +2,15 @@
 # Calculator Class      #
 ########################
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import csv
 from decimal import Decimal
+from functools import lru_cache
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Deque, List, Optional, Union
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
@@ -18,10 +20,49 @@ from app.history import HistoryObserver
 from app.input_validators import InputValidator
 from app.operations import Operation
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 # Type aliases for better readability
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
+# Column order of the persisted history CSV
+HISTORY_FIELDS = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
+# Header line of the persisted history CSV, using csv's default \r\n terminator
+HISTORY_HEADER = ','.join(HISTORY_FIELDS) + '\r\n'
+
+# Characters that would need quoting in a history CSV row; operation names
+# containing them are rejected so rows can be joined without csv.writer
+CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+# Number of distinct (operation, operand1, operand2) results memoized per calculator
+RESULT_CACHE_SIZE = 256
+
+
+def _write_history_file(path: Path, payload: str, encoding: str) -> None:
+    """
+    Write serialized history CSV text to disk.
+
+    The text is written to a temporary file next to the destination and then
+    moved over it with os.replace, so readers never see a partially written CSV
+    and a failed write leaves the previous file intact.
+
+    Args:
+        path (Path): Destination history file.
+        payload (str): CSV text to write.
+        encoding (str): File encoding.
+    """
+    temp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_path, 'w', newline='', encoding=encoding) as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
 class Calculator:
     """
@@ -57,16 +98,29 @@ class Calculator:
         # Set up the logging system
         self._setup_logging()
 
-        # Initialize calculation history and operation strategy
-        self.history: List[Calculation] = []
+        # Initialize calculation history and operation strategy; the bounded deque
+        # discards the oldest entry once max_history_size is reached
+        self.history: Deque[Calculation] = deque(maxlen=self.config.max_history_size)
         self.operation_strategy: Optional[Operation] = None
 
+        # Memoize operation results keyed by (operation name, operand1, operand2)
+        self._compute = lru_cache(maxsize=RESULT_CACHE_SIZE)(self._execute_operation)
+
         # Initialize observer list for the Observer pattern
         self.observers: List[HistoryObserver] = []
 
         # Initialize stacks for undo and redo functionality using the Memento pattern
-        self.undo_stack: List[CalculatorMemento] = []
-        self.redo_stack: List[CalculatorMemento] = []
+        self.undo_stack: Deque[CalculatorMemento] = deque()
+        self.redo_stack: Deque[CalculatorMemento] = deque()
+
+        # Count history changes and the last count written to disk, so observers
+        # can tell whether there are unsaved calculations
+        self.history_version = 0
+        self.saved_version = 0
+
+        # Single worker for background history writes, so writes stay ordered
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-io")
+        self._pending_write: Optional[Future] = None
 
         # Create required directories for history management
         self._setup_directories()
@@ -136,6 +190,7 @@ class Calculator:
             observer (HistoryObserver): The observer to be removed.
         """
         self.observers.remove(observer)
+        observer.detach()
         logging.info(f"Removed observer: {observer.__class__.__name__}")
 
     def notify_observers(self, calculation: Calculation) -> None:
@@ -165,6 +220,25 @@ class Calculator:
         self.operation_strategy = operation
         logging.info(f"Set operation: {operation}")
 
+    def _execute_operation(self, _operation_type: type, a: Decimal, b: Decimal) -> Decimal:
+        """
+        Execute the current operation strategy on validated operands.
+
+        Wrapped by an LRU cache in __init__; the strategy's class is part of the
+        cache key so results of different operations never collide, even when
+        two registered classes share a name.
+
+        Args:
+            _operation_type (type): Class of the current operation strategy; only
+                used as part of the cache key.
+            a (Decimal): The first validated operand.
+            b (Decimal): The second validated operand.
+
+        Returns:
+            Decimal: The result of the operation.
+        """
+        return self.operation_strategy.execute(a, b)
+
     def perform_operation(
         self,
         a: Union[str, Number],
@@ -184,44 +258,54 @@ class Calculator:
             CalculationResult: The result of the calculation.
 
         Raises:
-            OperationError: If no operation is set or if the operation fails.
+            OperationError: If no operation is set, the operation name cannot be
+                stored in the history CSV, or the operation fails.
             ValidationError: If input validation fails.
         """
         if not self.operation_strategy:
             raise OperationError("No operation set")
 
+        operation_name = str(self.operation_strategy)
+        if not CSV_SPECIAL_CHARS.isdisjoint(operation_name):
+            raise OperationError(f"Invalid operation name: {operation_name!r}")
+
         try:
             # Validate and convert inputs to Decimal
             validated_a = InputValidator.validate_number(a, self.config)
             validated_b = InputValidator.validate_number(b, self.config)
 
-            # Execute the operation strategy
-            result = self.operation_strategy.execute(validated_a, validated_b)
+            # Execute the operation strategy, reusing memoized results; operands of
+            # commutative operations are ordered so a+b and b+a share an entry
+            key_a, key_b = validated_a, validated_b
+            if self.operation_strategy.commutative and key_b < key_a:
+                key_a, key_b = key_b, key_a
+            result = self._compute(type(self.operation_strategy), key_a, key_b)
 
-            # Create a new Calculation instance with the operation details
+            # Create a new Calculation instance with the operation details, reusing
+            # the computed result so history and the return value share one source
             calculation = Calculation(
-                operation=str(self.operation_strategy),
+                operation=operation_name,
                 operand1=validated_a,
-                operand2=validated_b
+                operand2=validated_b,
+                result=result
             )
 
-            # Save the current state to the undo stack before making changes
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
+            # Save the current state to the undo stack before making changes; the
+            # snapshot shares the immutable Calculation instances with the history
+            self.undo_stack.append(CalculatorMemento(tuple(self.history)))
 
             # Clear the redo stack since new operation invalidates the redo history
             self.redo_stack.clear()
 
-            # Append the new calculation to the history
+            # Append the new calculation to the history (the deque drops the oldest
+            # entry when max_history_size is exceeded)
             self.history.append(calculation)
-
-            # Ensure the history does not exceed the maximum size
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+            self.history_version += 1
 
             # Notify all observers about the new calculation
             self.notify_observers(calculation)
 
-            return result
+            return calculation.result
 
         except ValidationError as e:
             # Log and re-raise validation errors
@@ -232,12 +316,22 @@ class Calculator:
             logging.error(f"Operation failed: {str(e)}")
             raise OperationError(f"Operation failed: {str(e)}")
 
-    def save_history(self) -> None:
+    def save_history(self, background: bool = False) -> None:
         """
-        Save calculation history to a CSV file using pandas.
+        Save calculation history to a CSV file.
 
-        Serializes the history of calculations and writes them to a CSV file for
-        persistent storage. Utilizes pandas DataFrames for efficient data handling.
+        Serializes the history of calculations to CSV text on the calling thread.
+        Rows are joined directly rather than through csv.writer: perform_operation
+        rejects operation names containing commas, quotes or newlines, and
+        numbers and ISO timestamps never contain them, so no field needs quoting.
+        The file write either happens immediately
+        or, when background is True, is handed to a single-worker thread pool so
+        the caller does not block on disk I/O. Writes are applied in order; a
+        foreground save first waits for any pending background write.
+
+        Args:
+            background (bool, optional): Write the file on the I/O thread.
+                Defaults to False.
 
         Raises:
             OperationError: If saving the history fails.
@@ -246,27 +340,30 @@ class Calculator:
             # Ensure the history directory exists
             self.config.history_dir.mkdir(parents=True, exist_ok=True)
 
-            history_data = []
-            for calc in self.history:
-                # Serialize each Calculation instance to a dictionary
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-
-            if history_data:
-                # Create a pandas DataFrame from the history data
-                df = pd.DataFrame(history_data)
-                # Write the DataFrame to a CSV file without the index
-                df.to_csv(self.config.history_file, index=False)
-                logging.info(f"History saved successfully to {self.config.history_file}")
+            # Always write the header so an empty history still yields a valid file,
+            # followed by one row per serialized Calculation instance
+            payload = HISTORY_HEADER + ''.join(
+                ','.join(row[name] for name in HISTORY_FIELDS) + '\r\n'
+                for row in (calc.to_dict() for calc in self.history)
+            )
+
+            version = self.history_version
+            path = self.config.history_file
+            encoding = self.config.default_encoding
+            if background:
+                self._pending_write = self._io_pool.submit(
+                    self._write_history_in_background, path, payload, encoding, version
+                )
+                logging.info(f"History save to {path} scheduled")
+                return
+
+            self.wait_for_pending_save()
+            _write_history_file(path, payload, encoding)
+            self.saved_version = version
+
+            if self.history:
+                logging.info(f"History saved successfully to {path}")
             else:
-                # If history is empty, create an empty CSV with headers
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                           ).to_csv(self.config.history_file, index=False)
                 logging.info("Empty history saved")
 
         except Exception as e:
@@ -274,53 +371,110 @@ class Calculator:
             logging.error(f"Failed to save history: {e}")
             raise OperationError(f"Failed to save history: {e}")
 
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """
+        Whether the history has changed since it was last written to disk.
+
+        Returns:
+            bool: True if there are calculations not yet saved.
+        """
+        return self.history_version != self.saved_version
+
+    def wait_for_pending_save(self) -> None:
+        """
+        Block until any background history write has finished.
+        """
+        if self._pending_write is not None:
+            self._pending_write.result()
+            self._pending_write = None
+
+    def close(self) -> None:
+        """
+        Finish pending background writes and shut down the I/O thread.
+
+        Foreground saves still work after closing; background saves do not.
+        """
+        self._io_pool.shutdown(wait=True)
+        self._pending_write = None
+
+    def _write_history_in_background(
+        self, path: Path, payload: str, encoding: str, version: int
+    ) -> None:
+        """
+        Write a serialized history on the I/O thread, logging any failure.
+
+        The history is only marked as saved once the write succeeds, so a
+        failed write leaves the changes for a later save or flush.
+
+        Args:
+            path (Path): Destination history file.
+            payload (str): CSV text to write.
+            encoding (str): File encoding.
+            version (int): History version the payload was serialized from.
+        """
+        try:
+            _write_history_file(path, payload, encoding)
+            self.saved_version = version
+            logging.info(f"History saved successfully to {path}")
+        except Exception as e:
+            logging.error(f"Failed to save history: {e}")
+
     def load_history(self) -> None:
         """
-        Load calculation history from a CSV file using pandas.
+        Load calculation history from a CSV file.
 
         Reads the calculation history from a CSV file and reconstructs the
-        Calculation instances, restoring the calculator's history.
+        Calculation instances, restoring the calculator's history. Any pending
+        background write is finished first, so the file read is complete.
 
         Raises:
             OperationError: If loading the history fails.
         """
         try:
-            if self.config.history_file.exists():
-                # Read the CSV file into a pandas DataFrame
-                df = pd.read_csv(self.config.history_file)
-                if not df.empty:
+            self.wait_for_pending_save()
+            if not self.config.history_file.exists():
+                # If no history file exists, start with an empty history
+                logging.info("No history file found - starting with empty history")
+            elif self.config.history_file.stat().st_size <= len(
+                HISTORY_HEADER.encode(self.config.default_encoding)
+            ):
+                # Empty or header-only file (no larger than the encoded header):
+                # nothing to parse
+                logging.info("Loaded empty history file")
+            else:
+                with open(
+                    self.config.history_file, newline='',
+                    encoding=self.config.default_encoding
+                ) as f:
                     # Deserialize each row into a Calculation instance
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'operand1': row['operand1'],
-                            'operand2': row['operand2'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
+                    history = [Calculation.from_dict(row) for row in csv.DictReader(f)]
+                if history:
+                    self.history = deque(history, maxlen=self.config.max_history_size)
+                    # The in-memory history now matches the file
+                    self.history_version += 1
+                    self.saved_version = self.history_version
                     logging.info(f"Loaded {len(self.history)} calculations from history")
                 else:
                     logging.info("Loaded empty history file")
-            else:
-                # If no history file exists, start with an empty history
-                logging.info("No history file found - starting with empty history")
         except Exception as e:
             # Log and raise an OperationError if loading fails
             logging.error(f"Failed to load history: {e}")
             raise OperationError(f"Failed to load history: {e}")
 
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def get_history_dataframe(self) -> 'pd.DataFrame':
         """
         Get calculation history as a pandas DataFrame.
 
         Converts the list of Calculation instances into a pandas DataFrame for
-        advanced data manipulation or analysis.
+        advanced data manipulation or analysis. pandas is imported on demand so
+        that it is only loaded when this analysis helper is actually used.
 
         Returns:
             pd.DataFrame: DataFrame containing the calculation history.
         """
+        import pandas as pd
+
         history_data = []
         for calc in self.history:
             history_data.append({
@@ -353,8 +507,10 @@ class Calculator:
         Empties the calculation history and clears the undo and redo stacks.
         """
         self.history.clear()
+        self.history_version += 1
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self._compute.cache_clear()
         logging.info("History cleared")
 
     def undo(self) -> bool:
@@ -372,9 +528,10 @@ class Calculator:
         # Pop the last state from the undo stack
         memento = self.undo_stack.pop()
         # Push the current state onto the redo stack
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
+        self.redo_stack.append(CalculatorMemento(tuple(self.history)))
         # Restore the history from the memento
-        self.history = memento.history.copy()
+        self.history = deque(memento.history, maxlen=self.config.max_history_size)
+        self.history_version += 1
         return True
 
     def redo(self) -> bool:
@@ -391,7 +548,8 @@ class Calculator:
         # Pop the last state from the redo stack
         memento = self.redo_stack.pop()
         # Push the current state onto the undo stack
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
+        self.undo_stack.append(CalculatorMemento(tuple(self.history)))
         # Restore the history from the memento
-        self.history = memento.history.copy()
+        self.history = deque(memento.history, maxlen=self.config.max_history_size)
+        self.history_version += 1
         return True
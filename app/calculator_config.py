@@ -4,6 +4,7 @@
 
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import cached_property
 from numbers import Number
 from pathlib import Path
 import os
@@ -40,10 +41,12 @@ class CalculatorConfig:
 
     This class manages all configuration parameters required by the calculator
     application, including directory paths, history size, auto-save preferences,
-    calculation precision, maximum input values, and default encoding.
+    auto-save batching, calculation precision, maximum input values, and
+    default encoding.
 
     Configuration can be set via environment variables or by passing parameters
-    directly to the class constructor.
+    directly to the class constructor. Directory and file paths are computed
+    on first access and cached for the lifetime of the instance.
     """
 
     def __init__(
@@ -51,6 +54,7 @@ class CalculatorConfig:
         base_dir: Optional[Path] = None,
         max_history_size: Optional[int] = None,
         auto_save: Optional[bool] = None,
+        autosave_batch_size: Optional[int] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
         default_encoding: Optional[str] = None
@@ -62,6 +66,7 @@ class CalculatorConfig:
             base_dir (Optional[Path], optional): Base directory for the calculator. Defaults to None.
             max_history_size (Optional[int], optional): Maximum number of history entries. Defaults to None.
             auto_save (Optional[bool], optional): Whether to auto-save history. Defaults to None.
+            autosave_batch_size (Optional[int], optional): Number of calculations between auto-saves. Defaults to None.
             precision (Optional[int], optional): Number of decimal places for calculations. Defaults to None.
             max_input_value (Optional[Number], optional): Maximum allowed input value. Defaults to None.
             default_encoding (Optional[str], optional): Default encoding for file operations. Defaults to None.
@@ -83,6 +88,11 @@ class CalculatorConfig:
             auto_save_env == 'true' or auto_save_env == '1'
         )
 
+        # Number of calculations to batch between auto-saves
+        self.autosave_batch_size = autosave_batch_size or int(
+            os.getenv('CALCULATOR_AUTOSAVE_BATCH_SIZE', '50')
+        )
+
         # Calculation precision
         self.precision = precision or int(
             os.getenv('CALCULATOR_PRECISION', '10')
@@ -98,7 +108,7 @@ class CalculatorConfig:
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
 
-    @property
+    @cached_property
     def log_dir(self) -> Path:
         """
         Get log directory path.
@@ -113,7 +123,7 @@ class CalculatorConfig:
             str(self.base_dir / "logs")
         )).resolve()
 
-    @property
+    @cached_property
     def history_dir(self) -> Path:
         """
         Get history directory path.
@@ -128,7 +138,7 @@ class CalculatorConfig:
             str(self.base_dir / "history")
         )).resolve()
 
-    @property
+    @cached_property
     def history_file(self) -> Path:
         """
         Get history file path.
@@ -143,7 +153,7 @@ class CalculatorConfig:
             str(self.history_dir / "calculator_history.csv")
         )).resolve()
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         """
         Get log file path.
@@ -170,6 +180,8 @@ class CalculatorConfig:
         """
         if self.max_history_size <= 0:
             raise ConfigurationError("max_history_size must be positive")
+        if self.autosave_batch_size <= 0:
+            raise ConfigurationError("autosave_batch_size must be positive")
         if self.precision <= 0:
             raise ConfigurationError("precision must be positive")
         if self.max_input_value <= 0:
@@ -4,21 +4,23 @@
 
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Tuple
 
 from app.calculation import Calculation
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorMemento:
     """
     Stores calculator state for undo/redo functionality.
 
     The Memento pattern allows the Calculator to save its current state (history)
     so that it can be restored later. This enables features like undo and redo.
+    Calculation instances are immutable, so a snapshot is a tuple that shares
+    them with the live history rather than copying each calculation.
     """
 
-    history: List[Calculation]  # List of Calculation instances representing the calculator's history
+    history: Tuple[Calculation, ...]  # Calculation instances representing the calculator's history
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the memento was created
 
     def to_dict(self) -> Dict[str, Any]:
@@ -51,6 +53,6 @@ class CalculatorMemento:
             CalculatorMemento: A new instance of CalculatorMemento with restored state.
         """
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
+            history=tuple(Calculation.from_dict(calc) for calc in data['history']),
             timestamp=datetime.datetime.fromisoformat(data['timestamp'])
         )
@@ -3,13 +3,154 @@
 ########################
 
 from decimal import Decimal
+from functools import partial
 import logging
+from typing import Callable, Dict
 
 from app.calculator import Calculator
 from app.exceptions import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
 from app.operations import OperationFactory
 
+# Help text listing the available REPL commands
+HELP_TEXT = (
+    "\nAvailable commands:\n"
+    "  add, subtract, multiply, divide, power, root - Perform calculations\n"
+    "  history - Show calculation history\n"
+    "  clear - Clear calculation history\n"
+    "  undo - Undo the last calculation\n"
+    "  redo - Redo the last undone calculation\n"
+    "  save - Save calculation history to file\n"
+    "  load - Load calculation history from file\n"
+    "  exit - Exit the calculator"
+)
+
+# Commands that perform an arithmetic operation
+OPERATION_COMMANDS = ('add', 'subtract', 'multiply', 'divide', 'power', 'root')
+
+
+def _handle_help(calc: Calculator) -> bool:
+    """Display available commands."""
+    print(HELP_TEXT)
+    return False
+
+
+def _handle_exit(calc: Calculator) -> bool:
+    """Attempt to save history before exiting; returns True to stop the REPL."""
+    try:
+        calc.save_history()
+        print("History saved successfully.")
+    except Exception as e:
+        print(f"Warning: Could not save history: {e}")
+    print("Goodbye!")
+    return True
+
+
+def _handle_history(calc: Calculator) -> bool:
+    """Display calculation history."""
+    history = calc.show_history()
+    if not history:
+        print("No calculations in history")
+    else:
+        print("\nCalculation History:")
+        for i, entry in enumerate(history, 1):
+            print(f"{i}. {entry}")
+    return False
+
+
+def _handle_clear(calc: Calculator) -> bool:
+    """Clear calculation history."""
+    calc.clear_history()
+    print("History cleared")
+    return False
+
+
+def _handle_undo(calc: Calculator) -> bool:
+    """Undo the last calculation."""
+    if calc.undo():
+        print("Operation undone")
+    else:
+        print("Nothing to undo")
+    return False
+
+
+def _handle_redo(calc: Calculator) -> bool:
+    """Redo the last undone calculation."""
+    if calc.redo():
+        print("Operation redone")
+    else:
+        print("Nothing to redo")
+    return False
+
+
+def _handle_save(calc: Calculator) -> bool:
+    """Save calculation history to file."""
+    try:
+        calc.save_history()
+        print("History saved successfully")
+    except Exception as e:
+        print(f"Error saving history: {e}")
+    return False
+
+
+def _handle_load(calc: Calculator) -> bool:
+    """Load calculation history from file."""
+    try:
+        calc.load_history()
+        print("History loaded successfully")
+    except Exception as e:
+        print(f"Error loading history: {e}")
+    return False
+
+
+def _handle_operation(command: str, calc: Calculator) -> bool:
+    """Prompt for operands and perform the arithmetic operation named by command."""
+    try:
+        print("\nEnter numbers (or 'cancel' to abort):")
+        a = input("First number: ")
+        if a.lower() == 'cancel':
+            print("Operation cancelled")
+            return False
+        b = input("Second number: ")
+        if b.lower() == 'cancel':
+            print("Operation cancelled")
+            return False
+
+        # Create the appropriate operation instance using the Factory pattern
+        operation = OperationFactory.create_operation(command)
+        calc.set_operation(operation)
+
+        # Perform the calculation
+        result = calc.perform_operation(a, b)
+
+        # Normalize the result if it's a Decimal
+        if isinstance(result, Decimal):
+            result = result.normalize()
+
+        print(f"\nResult: {result}")
+    except (ValidationError, OperationError) as e:
+        # Handle known exceptions related to validation or operation errors
+        print(f"Error: {e}")
+    except Exception as e:
+        # Handle any unexpected exceptions
+        print(f"Unexpected error: {e}")
+    return False
+
+
+# Dispatch table mapping each command to its handler; a handler returns True
+# when the REPL should stop
+DISPATCH: Dict[str, Callable[[Calculator], bool]] = {
+    'help': _handle_help,
+    'exit': _handle_exit,
+    'history': _handle_history,
+    'clear': _handle_clear,
+    'undo': _handle_undo,
+    'redo': _handle_redo,
+    'save': _handle_save,
+    'load': _handle_load,
+    **{command: partial(_handle_operation, command) for command in OPERATION_COMMANDS},
+}
+
 
 def calculator_repl(): # pragma: no cover
     """
@@ -17,6 +158,7 @@ def calculator_repl(): # pragma: no cover
 
     Implements a Read-Eval-Print Loop (REPL) that continuously prompts the user
     for commands, processes arithmetic operations, and manages calculation history.
+    Commands are resolved through the DISPATCH table.
     """
     try:
         # Initialize the Calculator instance
@@ -33,116 +175,15 @@ def calculator_repl(): # pragma: no cover
                 # Prompt the user for a command
                 command = input("\nEnter command: ").lower().strip()
 
-                if command == 'help':
-                    # Display available commands
-                    print("\nAvailable commands:")
-                    print("  add, subtract, multiply, divide, power, root - Perform calculations")
-                    print("  history - Show calculation history")
-                    print("  clear - Clear calculation history")
-                    print("  undo - Undo the last calculation")
-                    print("  redo - Redo the last undone calculation")
-                    print("  save - Save calculation history to file")
-                    print("  load - Load calculation history from file")
-                    print("  exit - Exit the calculator")
+                handler = DISPATCH.get(command)
+                if handler is None:
+                    # Handle unknown commands
+                    print(f"Unknown command: '{command}'. Type 'help' for available commands.")
                     continue
 
-                if command == 'exit':
-                    # Attempt to save history before exiting
-                    try:
-                        calc.save_history()
-                        print("History saved successfully.")
-                    except Exception as e:
-                        print(f"Warning: Could not save history: {e}")
-                    print("Goodbye!")
+                if handler(calc):
                     break
 
-                if command == 'history':
-                    # Display calculation history
-                    history = calc.show_history()
-                    if not history:
-                        print("No calculations in history")
-                    else:
-                        print("\nCalculation History:")
-                        for i, entry in enumerate(history, 1):
-                            print(f"{i}. {entry}")
-                    continue
-
-                if command == 'clear':
-                    # Clear calculation history
-                    calc.clear_history()
-                    print("History cleared")
-                    continue
-
-                if command == 'undo':
-                    # Undo the last calculation
-                    if calc.undo():
-                        print("Operation undone")
-                    else:
-                        print("Nothing to undo")
-                    continue
-
-                if command == 'redo':
-                    # Redo the last undone calculation
-                    if calc.redo():
-                        print("Operation redone")
-                    else:
-                        print("Nothing to redo")
-                    continue
-
-                if command == 'save':
-                    # Save calculation history to file
-                    try:
-                        calc.save_history()
-                        print("History saved successfully")
-                    except Exception as e:
-                        print(f"Error saving history: {e}")
-                    continue
-
-                if command == 'load':
-                    # Load calculation history from file
-                    try:
-                        calc.load_history()
-                        print("History loaded successfully")
-                    except Exception as e:
-                        print(f"Error loading history: {e}")
-                    continue
-
-                if command in ['add', 'subtract', 'multiply', 'divide', 'power', 'root']:
-                    # Perform the specified arithmetic operation
-                    try:
-                        print("\nEnter numbers (or 'cancel' to abort):")
-                        a = input("First number: ")
-                        if a.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-                        b = input("Second number: ")
-                        if b.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-
-                        # Create the appropriate operation instance using the Factory pattern
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-
-                        # Perform the calculation
-                        result = calc.perform_operation(a, b)
-
-                        # Normalize the result if it's a Decimal
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-
-                        print(f"\nResult: {result}")
-                    except (ValidationError, OperationError) as e:
-                        # Handle known exceptions related to validation or operation errors
-                        print(f"Error: {e}")
-                    except Exception as e:
-                        # Handle any unexpected exceptions
-                        print(f"Unexpected error: {e}")
-                    continue
-
-                # Handle unknown commands
-                print(f"Unknown command: '{command}'. Type 'help' for available commands.")
-
             except KeyboardInterrupt:
                 # Handle Ctrl+C interruption gracefully
                 print("\nOperation cancelled")
@@ -156,6 +197,9 @@ def calculator_repl(): # pragma: no cover
                 print(f"Error: {e}")
                 continue
 
+        # Let any background history write finish before leaving the REPL
+        calc.close()
+
     except Exception as e:
         # Handle fatal errors during initialization
         print(f"Fatal error: {e}")
@@ -3,6 +3,7 @@
 ########################
 
 from abc import ABC, abstractmethod
+import atexit
 import logging
 from typing import Any
 from app.calculation import Calculation
@@ -27,6 +28,15 @@ class HistoryObserver(ABC):
         """
         pass  # pragma: no cover
 
+    def detach(self) -> None:
+        """
+        Release resources held by the observer.
+
+        Called when the observer is removed from a calculator. The default
+        implementation does nothing.
+        """
+        pass
+
 
 class LoggingObserver(HistoryObserver):
     """
@@ -61,7 +71,11 @@ class AutoSaveObserver(HistoryObserver):
 
     Implements the Observer pattern by listening for new calculations and
     triggering an automatic save of the calculation history if the auto-save
-    feature is enabled in the configuration.
+    feature is enabled in the configuration. Saves are batched: the history is
+    written once every autosave_batch_size calculations, and any remaining
+    unsaved calculations are flushed when the interpreter exits. Unsaved work
+    is tracked through the calculator's history_version and saved_version, so
+    explicit saves also count.
     """
 
     def __init__(self, calculator: Any):
@@ -70,7 +84,8 @@ class AutoSaveObserver(HistoryObserver):
 
         Args:
             calculator (Any): The calculator instance to interact with.
-                Must have 'config' and 'save_history' attributes.
+                Must have 'config' and 'save_history' attributes, and expose
+                'history_version', 'saved_version' and 'has_unsaved_changes'.
 
         Raises:
             TypeError: If the calculator does not have the required attributes.
@@ -78,19 +93,68 @@ class AutoSaveObserver(HistoryObserver):
         if not hasattr(calculator, 'config') or not hasattr(calculator, 'save_history'):
             raise TypeError("Calculator must have 'config' and 'save_history' attributes")
         self.calculator = calculator
+        # History version handed to the last batched save
+        self._submitted_version = 0
+        atexit.register(self.flush)
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of history changes since the last save or batched save request.
+
+        Returns:
+            int: Changes not yet covered by a save.
+        """
+        return self.calculator.history_version - max(
+            self.calculator.saved_version, self._submitted_version
+        )
 
     def update(self, calculation: Calculation) -> None:
         """
         Trigger auto-save.
 
         This method is called whenever a new calculation is performed. If the
-        auto-save feature is enabled, it saves the current calculation history.
+        auto-save feature is enabled, it marks the history as dirty and saves it
+        once autosave_batch_size calculations have accumulated.
 
         Args:
             calculation (Calculation): The calculation that was performed.
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
-        if self.calculator.config.auto_save:
+        if (self.calculator.config.auto_save
+                and self.pending >= self.calculator.config.autosave_batch_size):
+            self._save()
+
+    def flush(self) -> None:
+        """
+        Save any calculations not yet written by a batched auto-save.
+
+        Registered with atexit so the final state is persisted on shutdown.
+        Does nothing if the calculator has no unsaved changes, e.g. after the
+        REPL's exit command has already saved. The save runs in the foreground,
+        since background workers are no longer accepting work at interpreter
+        exit. Errors are logged rather than raised.
+        """
+        if not self.calculator.config.auto_save or not self.calculator.has_unsaved_changes:
+            return
+        try:
             self.calculator.save_history()
             logging.info("History auto-saved")
+        except Exception as e:
+            logging.error(f"Failed to flush auto-saved history: {e}")
+
+    def detach(self) -> None:
+        """
+        Unregister the atexit flush so the observer and its calculator can be freed.
+        """
+        atexit.unregister(self.flush)
+
+    def _save(self) -> None:
+        """
+        Save the calculator history in the background and start a new batch.
+        """
+        version = self.calculator.history_version
+        self.calculator.save_history(background=True)
+        self._submitted_version = version
+        logging.info("History auto-saved")
@@ -4,10 +4,14 @@
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+import re
 from typing import Any
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
+# Plain decimal or scientific notation number, e.g. "-12", "3.5", ".5", "1e10"
+_NUMBER_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
 @dataclass
 class InputValidator:
     """Validates and sanitizes calculator inputs."""
@@ -16,6 +20,10 @@ class InputValidator:
     def validate_number(value: Any, config: CalculatorConfig) -> Decimal:
         """
         Validate and convert input to Decimal.
+
+        Decimal and int inputs are converted directly; everything else is
+        checked against a precompiled number pattern before conversion, so
+        malformed input is rejected without a failed Decimal parse.
         
         Args:
             value: Input value to validate
@@ -28,9 +36,15 @@ class InputValidator:
             ValidationError: If input is invalid
         """
         try:
-            if isinstance(value, str):
-                value = value.strip()
-            number = Decimal(str(value))
+            if isinstance(value, Decimal):
+                number = value
+            elif isinstance(value, int) and not isinstance(value, bool):
+                number = Decimal(value)
+            else:
+                value = value.strip() if isinstance(value, str) else str(value)
+                if not _NUMBER_RE.fullmatch(value):
+                    raise ValidationError(f"Invalid number format: {value}")
+                number = Decimal(value)
             if abs(number) > config.max_input_value:
                 raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
             return number.normalize()
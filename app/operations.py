@@ -4,10 +4,30 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict
 from app.exceptions import ValidationError
 
 
+def decimal_power(a: Decimal, b: Decimal) -> Decimal:
+    """
+    Raise a to the power of b.
+
+    Uses exact Decimal exponentiation when b is integral and falls back to
+    float pow for fractional exponents and for 0 ** 0.
+
+    Args:
+        a (Decimal): Base number.
+        b (Decimal): Exponent.
+
+    Returns:
+        Decimal: Result of the exponentiation.
+    """
+    if b == b.to_integral_value() and (a != 0 or b != 0):
+        return a ** b
+    return Decimal(pow(float(a), float(b)))
+
+
 class Operation(ABC):
     """
     Abstract base class for calculator operations.
@@ -16,6 +36,9 @@ class Operation(ABC):
     implement the execute method and can optionally override operand validation.
     """
 
+    # Whether the operands can be swapped without changing the result
+    commutative: bool = False
+
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -70,6 +93,8 @@ class Addition(Operation):
     Performs the addition of two numbers.
     """
 
+    commutative = True
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Add two numbers.
@@ -114,6 +139,8 @@ class Multiplication(Operation):
     Performs the multiplication of two numbers.
     """
 
+    commutative = True
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Multiply two numbers.
@@ -196,6 +223,9 @@ class Power(Operation):
         """
         Calculate one number raised to the power of another.
 
+        Integral exponents are computed directly in Decimal, which is faster
+        and more precise than a float round trip.
+
         Args:
             a (Decimal): Base number.
             b (Decimal): Exponent.
@@ -204,7 +234,7 @@ class Power(Operation):
             Decimal: Result of the exponentiation.
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        return decimal_power(a, b)
 
 
 class Root(Operation):
@@ -285,14 +315,18 @@ class OperationFactory:
         if not issubclass(operation_class, Operation):
             raise TypeError("Operation class must inherit from Operation")
         cls._operations[name.lower()] = operation_class
+        # Drop cached instances so the new registration takes effect
+        cls.create_operation.cache_clear()
 
     @classmethod
+    @lru_cache(maxsize=None)
     def create_operation(cls, operation_type: str) -> Operation:
         """
         Create an operation instance based on the operation type.
 
         This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        _operations dictionary and instantiates it. Operations are stateless,
+        so instances are cached and shared between calls for the same type.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
@@ -1,17 +1,22 @@
 #!/usr/bin/env python3
 """Main entry point for the calculator application."""
 
+import sys
+
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
-from colorama import init, Fore, Style
+
+# Welcome banner, built once and written in a single call
+BANNER = f"{'=' * 50}\nWelcome to the Advanced Calculator\n{'=' * 50}\n"
 
 def main():
+    # colorama is only needed for the banner, so import it on first use
+    from colorama import init, Fore
+
     # Initialize colorama for cross-platform color support
     init(autoreset=True)
     
-    print(Fore.CYAN + "="*50)
-    print(Fore.CYAN + "Welcome to the Advanced Calculator")
-    print(Fore.CYAN + "="*50)
+    sys.stdout.write(Fore.CYAN + BANNER)
     
     config = CalculatorConfig()
     calculator = Calculator(config)
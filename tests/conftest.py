@@ -0,0 +1,19 @@
+import pytest
+
+from app.operations import OperationFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_operation_cache():
+    """Ensure cached operation instances do not leak patches between tests."""
+    OperationFactory.create_operation.cache_clear()
+    yield
+    OperationFactory.create_operation.cache_clear()
+
+
+@pytest.fixture
+def clear_path_env(monkeypatch):
+    """Remove path environment overrides, which would take precedence over base_dir."""
+    for var in ('CALCULATOR_LOG_DIR', 'CALCULATOR_LOG_FILE',
+                'CALCULATOR_HISTORY_DIR', 'CALCULATOR_HISTORY_FILE'):
+        monkeypatch.delenv(var, raising=False)
@@ -1,9 +1,11 @@
 import pytest
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 from datetime import datetime
 from app.calculation import Calculation
 from app.exceptions import OperationError
 import logging
+import sys
 
 
 def test_addition():
@@ -56,6 +58,18 @@ def test_unknown_operation():
         Calculation(operation="Unknown", operand1=Decimal("5"), operand2=Decimal("3"))
 
 
+def test_supplied_result_unknown_operation():
+    with pytest.raises(OperationError, match="Unknown operation: Max"):
+        Calculation(operation="Max", operand1=Decimal("5"), operand2=Decimal("3"), result=Decimal("5"))
+
+
+def test_result_is_keyword_only():
+    timestamp = datetime(2024, 1, 1, 12, 0)
+    calc = Calculation("Addition", Decimal("2"), Decimal("3"), timestamp)
+    assert calc.timestamp == timestamp
+    assert calc.result == Decimal("5")
+
+
 def test_to_dict():
     calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
     result_dict = calc.to_dict()
@@ -83,6 +97,18 @@ def test_from_dict():
     assert calc.result == Decimal("5")
 
 
+def test_from_dict_interns_operation():
+    data = {
+        "operation": "".join(["Addi", "tion"]),
+        "operand1": "2",
+        "operand2": "3",
+        "result": "5",
+        "timestamp": datetime.now().isoformat()
+    }
+    calc = Calculation.from_dict(data)
+    assert calc.operation is sys.intern("Addition")
+
+
 def test_invalid_from_dict():
     data = {
         "operation": "Addition",
@@ -109,6 +135,33 @@ def test_equality():
     assert calc1 != calc3
 
 
+
+def test_calculation_uses_slots():
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    assert not hasattr(calc, "__dict__")
+
+
+def test_calculation_is_frozen():
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    with pytest.raises(FrozenInstanceError):
+        calc.result = Decimal("6")
+
+
+def test_to_dict_is_cached_copy():
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    first = calc.to_dict()
+    first["result"] = "tampered"
+    # Mutating a returned dict does not affect the cached serialization
+    assert calc.to_dict()["result"] == "5"
+    assert calc.to_dict() is not calc.to_dict()
+
+
+def test_equal_calculations_hash_equal():
+    calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    calc2 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    assert hash(calc1) == hash(calc2)
+
+
 # New Test to Cover Logging Warning
 def test_from_dict_result_mismatch(caplog):
     """
@@ -1,59 +1,40 @@
 import datetime
 from pathlib import Path
-import pandas as pd
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, patch
 from decimal import Decimal
 from tempfile import TemporaryDirectory
-from app.calculator import Calculator
-from app.calculator_repl import calculator_repl
+from app.calculator import HISTORY_FIELDS, Calculator
+from app.calculator_repl import HELP_TEXT, calculator_repl
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
-from app.operations import OperationFactory
+from app.operations import Operation, OperationFactory
 
 # Fixture to initialize Calculator with a temporary directory for file paths
 @pytest.fixture
-def calculator():
+def calculator(clear_path_env):
     with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-
-        # Patch properties to use the temporary directory paths
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            # Set return values to use paths within the temporary directory
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            # Return an instance of Calculator with the mocked config
-            yield Calculator(config=config)
+        yield Calculator(config=CalculatorConfig(base_dir=Path(temp_dir)))
 
 # Test Calculator Initialization
 
 def test_calculator_initialization(calculator):
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert len(calculator.history) == 0
+    assert len(calculator.undo_stack) == 0
+    assert len(calculator.redo_stack) == 0
     assert calculator.operation_strategy is None
 
 # Test Logging Setup
 
 @patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        # Instantiate calculator to trigger logging
-        calculator = Calculator(CalculatorConfig())
-        logging_info_mock.assert_any_call("Calculator initialized with configuration")
+def test_logging_setup(logging_info_mock, tmp_path, clear_path_env):
+    # Instantiate calculator to trigger logging
+    calculator = Calculator(CalculatorConfig(base_dir=tmp_path))
+    logging_info_mock.assert_any_call(
+        f"Logging initialized at: {(tmp_path / 'logs' / 'calculator.log').resolve()}"
+    )
+    logging_info_mock.assert_any_call("Calculator initialized with configuration")
 
 # Test Adding and Removing Observers
 
@@ -92,6 +73,61 @@ def test_perform_operation_operation_error(calculator):
     with pytest.raises(OperationError, match="No operation set"):
         calculator.perform_operation(2, 3)
 
+def test_perform_operation_memoizes_result(calculator):
+    operation = OperationFactory.create_operation('add')
+    calculator.set_operation(operation)
+    with patch.object(operation, 'execute', wraps=operation.execute) as mock_execute:
+        assert calculator.perform_operation(2, 3) == Decimal('5')
+        # Commutative operands share the cached entry
+        assert calculator.perform_operation(3, 2) == Decimal('5')
+        mock_execute.assert_called_once()
+    # Each call is still recorded in history
+    assert len(calculator.history) == 2
+
+def test_perform_operation_computes_once(calculator):
+    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    with patch('app.calculator.Calculation.calculate') as mock_calculate:
+        result = calculator.perform_operation('0', '5')
+        cached = calculator.perform_operation('-0', '5')
+    mock_calculate.assert_not_called()
+    # The returned value and the history entry come from the same computation
+    assert str(result) == str(calculator.history[0].result)
+    assert str(cached) == str(calculator.history[-1].result)
+
+def test_result_cache_keyed_by_operation_class(calculator):
+    def make_operation(execute):
+        return type('Addition', (Operation,), {'execute': lambda self, a, b: execute(a, b)})()
+    calculator.set_operation(make_operation(lambda a, b: a + b))
+    assert calculator.perform_operation(2, 3) == Decimal('5')
+    # A different class with the same __name__ must not reuse the cached result
+    calculator.set_operation(make_operation(lambda a, b: a * b))
+    assert calculator.perform_operation(2, 3) == Decimal('6')
+
+def test_perform_operation_rejects_operation_without_calculation(calculator):
+    class Max(Operation):
+        def execute(self, a, b):
+            return max(a, b)
+    calculator.set_operation(Max())
+    # History only records calculations that can be reloaded from the CSV
+    with pytest.raises(OperationError, match="Unknown operation: Max"):
+        calculator.perform_operation(2, 3)
+    assert len(calculator.history) == 0
+
+@pytest.mark.parametrize("name", ['Add,ition', 'Add"ition', 'Add\nition', 'Add\rition'])
+def test_perform_operation_rejects_csv_special_operation_name(calculator, name):
+    operation = OperationFactory.create_operation('add')
+    calculator.set_operation(operation)
+    with patch.object(type(operation), '__str__', return_value=name):
+        with pytest.raises(OperationError, match="Invalid operation name"):
+            calculator.perform_operation(2, 3)
+    assert len(calculator.history) == 0
+
+def test_clear_history_clears_result_cache(calculator):
+    calculator.set_operation(OperationFactory.create_operation('subtract'))
+    calculator.perform_operation(5, 3)
+    calculator.clear_history()
+    assert calculator._compute.cache_info().currsize == 0
+
 # Test Undo/Redo Functionality
 
 def test_undo(calculator):
@@ -99,7 +135,7 @@ def test_undo(calculator):
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.undo()
-    assert calculator.history == []
+    assert len(calculator.history) == 0
 
 def test_redo(calculator):
     operation = OperationFactory.create_operation('add')
@@ -109,27 +145,53 @@ def test_redo(calculator):
     calculator.redo()
     assert len(calculator.history) == 1
 
+def test_undo_snapshot_shares_calculations(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    calculator.perform_operation(4, 5)
+    snapshot = calculator.undo_stack[-1].history
+    assert isinstance(snapshot, tuple)
+    assert snapshot[0] is calculator.history[0]
+
 # Test History Management
 
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
+@patch('app.calculator._write_history_file')
+def test_save_history(mock_write, calculator):
     operation = OperationFactory.create_operation('add')
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.save_history()
-    mock_to_csv.assert_called_once()
-
-@patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
-    # Mock CSV data to match the expected format in from_dict
-    mock_read_csv.return_value = pd.DataFrame({
-        'operation': ['Addition'],
-        'operand1': ['2'],
-        'operand2': ['3'],
-        'result': ['5'],
-        'timestamp': [datetime.datetime.now().isoformat()]
-    })
+    mock_write.assert_called_once()
+
+def test_save_history_matches_csv_writer(calculator):
+    import csv
+    import io
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    calculator.perform_operation("1", "3")
+    calculator.perform_operation("-2.5", "1e3")
+    with patch('app.calculator._write_history_file') as mock_write:
+        calculator.save_history()
+    expected = io.StringIO()
+    writer = csv.DictWriter(expected, fieldnames=HISTORY_FIELDS)
+    writer.writeheader()
+    writer.writerows(calc.to_dict() for calc in calculator.history)
+    assert mock_write.call_args.args[1] == expected.getvalue()
+
+@patch('app.calculator.csv.DictReader')
+def test_load_history(mock_dict_reader, calculator):
+    # Write a non-empty history file so load_history parses it
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\nstub\n",
+        encoding=calculator.config.default_encoding
+    )
+    # Mock CSV rows to match the expected format in from_dict
+    mock_dict_reader.return_value = [{
+        'operation': 'Addition',
+        'operand1': '2',
+        'operand2': '3',
+        'result': '5',
+        'timestamp': datetime.datetime.now().isoformat()
+    }]
     
     # Test the load_history functionality
     try:
@@ -145,6 +207,98 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
         pytest.fail("Loading history failed due to OperationError")
         
             
+def test_header_only_history_file_is_not_parsed(calculator):
+    from app.calculator import HISTORY_HEADER
+    calculator.save_history()
+    header_bytes = len(HISTORY_HEADER.encode(calculator.config.default_encoding))
+    assert calculator.config.history_file.stat().st_size == header_bytes
+    # A header-only file is recognised as empty without being parsed
+    with patch('app.calculator.csv.DictReader') as mock_dict_reader:
+        calculator.load_history()
+    mock_dict_reader.assert_not_called()
+
+def test_save_and_load_history_round_trip(calculator):
+    calculator.set_operation(OperationFactory.create_operation('multiply'))
+    calculator.perform_operation("1.5", "4")
+    calculator.save_history()
+    calculator.clear_history()
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert calculator.history[0].operation == "Multiplication"
+    assert calculator.history[0].result == Decimal("6")
+
+def test_save_history_in_background(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    with patch('app.calculator._write_history_file') as mock_write:
+        calculator.save_history(background=True)
+        calculator.wait_for_pending_save()
+    mock_write.assert_called_once()
+    path, payload, _ = mock_write.call_args.args
+    assert path == calculator.config.history_file
+    assert payload.startswith("operation,operand1,operand2,result,timestamp")
+    assert "Addition,2,3,5," in payload
+
+@patch('app.calculator.logging.error')
+def test_background_save_failure_is_logged(mock_log_error, calculator):
+    with patch('app.calculator._write_history_file', side_effect=OSError("disk full")):
+        calculator.save_history(background=True)
+        calculator.wait_for_pending_save()
+    mock_log_error.assert_called_once_with("Failed to save history: disk full")
+
+def test_failed_background_save_leaves_history_unsaved(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    with patch('app.calculator._write_history_file', side_effect=OSError("disk full")):
+        calculator.save_history(background=True)
+        calculator.wait_for_pending_save()
+    # The failed batch is still pending for a later save or flush
+    assert calculator.has_unsaved_changes
+    calculator.save_history(background=True)
+    calculator.wait_for_pending_save()
+    assert not calculator.has_unsaved_changes
+
+def test_load_history_waits_for_background_save(calculator):
+    import threading
+    from app.calculator import _write_history_file
+    release = threading.Event()
+    def slow_write(*args):
+        release.wait(5)
+        _write_history_file(*args)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    with patch('app.calculator._write_history_file', side_effect=slow_write):
+        calculator.save_history(background=True)
+        calculator.clear_history()
+        threading.Timer(0.05, release.set).start()
+        calculator.load_history()
+    # The load read the finished file rather than a missing or partial one
+    assert len(calculator.history) == 1
+    assert calculator.history[0].result == Decimal('5')
+
+def test_failed_write_keeps_previous_history_file(calculator):
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    calculator.save_history()
+    history_file = calculator.config.history_file
+    saved = history_file.read_bytes()
+    calculator.perform_operation(4, 5)
+    with patch('app.calculator.os.replace', side_effect=OSError("disk full")):
+        with pytest.raises(OperationError):
+            calculator.save_history()
+    # The old file is untouched and the temporary file is removed
+    assert history_file.read_bytes() == saved
+    assert list(history_file.parent.iterdir()) == [history_file]
+
+def test_close_shuts_down_io_thread(calculator):
+    calculator.save_history(background=True)
+    calculator.close()
+    assert calculator._pending_write is None
+    # Foreground saves still work after closing
+    calculator.save_history()
+    with pytest.raises(OperationError):
+        calculator.save_history(background=True)
+
 # Test Clearing History
 
 def test_clear_history(calculator):
@@ -152,9 +306,11 @@ def test_clear_history(calculator):
     calculator.set_operation(operation)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert len(calculator.history) == 0
+    assert len(calculator.undo_stack) == 0
+    assert len(calculator.redo_stack) == 0
+    # Clearing in place keeps the history bound
+    assert calculator.history.maxlen == calculator.config.max_history_size
 
 # Test REPL Commands (using patches for input/output handling)
 
@@ -171,7 +327,18 @@ def test_calculator_repl_exit(mock_print, mock_input):
 @patch('builtins.print')
 def test_calculator_repl_help(mock_print, mock_input):
     calculator_repl()
-    mock_print.assert_any_call("\nAvailable commands:")
+    mock_print.assert_any_call(HELP_TEXT)
+    assert HELP_TEXT.startswith("\nAvailable commands:")
+
+@patch('builtins.input', side_effect=['undo', 'history', 'bogus', 'exit'])
+@patch('builtins.print')
+def test_calculator_repl_dispatch(mock_print, mock_input):
+    with patch('app.calculator.Calculator.save_history'), \
+         patch('app.calculator.Calculator.load_history'):
+        calculator_repl()
+    mock_print.assert_any_call("Nothing to undo")
+    mock_print.assert_any_call("No calculations in history")
+    mock_print.assert_any_call("Unknown command: 'bogus'. Type 'help' for available commands.")
 
 @patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
 @patch('builtins.print')
@@ -200,7 +367,7 @@ def test_calculator_init_with_load_history_failure():
             
             # Calculator should still initialize despite load failure
             assert calc is not None
-            assert calc.history == []
+            assert len(calc.history) == 0
 
 def test_calculator_logging_setup_failure():
     """Test calculator when logging setup fails."""
@@ -311,11 +478,13 @@ def test_calculator_load_empty_history_file():
         empty_df = pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp'])
         empty_df.to_csv(history_file, index=False)
         
-        # This should trigger line 305
-        calc = Calculator(config)
+        # Header-only files are recognised by size and never parsed
+        with patch('app.calculator.csv.DictReader') as mock_dict_reader:
+            calc = Calculator(config)
+        mock_dict_reader.assert_not_called()
         
         # History should be empty
-        assert calc.history == []
+        assert len(calc.history) == 0
 
 def test_calculator_undo_redo_empty_stacks():
     """Test undo/redo when stacks are empty."""
@@ -333,3 +502,15 @@ def test_calculator_undo_redo_empty_stacks():
         
         # Test redo with empty stack - line 390
         assert calc.redo() is False
+
+def test_calculator_import_does_not_load_pandas():
+    """Test that importing the calculator does not pull in pandas."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.calculator; print('pandas' in sys.modules)"],
+        capture_output=True, text=True, cwd=Path(__file__).parent.parent, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -1,5 +1,25 @@
 """Tests for calculator REPL module."""
 
+import pytest
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from app.calculator import Calculator
+from app.calculator_repl import (
+    HELP_TEXT,
+    _handle_clear,
+    _handle_exit,
+    _handle_help,
+    _handle_history,
+    _handle_load,
+    _handle_operation,
+    _handle_redo,
+    _handle_save,
+    _handle_undo,
+)
+from app.exceptions import OperationError, ValidationError
+
+
 def test_repl_module_imports():
     """Test that the REPL module can be imported."""
     from app import calculator_repl
@@ -15,3 +35,158 @@ def test_repl_has_docstring():
     from app.calculator_repl import calculator_repl
     assert calculator_repl.__doc__ is not None
     assert "REPL" in calculator_repl.__doc__
+
+def test_repl_dispatch_covers_help_commands():
+    """Test that every operation command has a dispatch handler."""
+    from app.calculator_repl import DISPATCH, OPERATION_COMMANDS
+    for command in OPERATION_COMMANDS + ('help', 'exit', 'history', 'clear', 'undo', 'redo', 'save', 'load'):
+        assert command in DISPATCH
+
+
+# Handler tests
+
+@pytest.fixture
+def calc():
+    """Calculator stand-in for the command handlers."""
+    return Mock(spec=Calculator)
+
+
+@patch('builtins.print')
+def test_handle_help(mock_print, calc):
+    """Test that help prints the command list."""
+    assert _handle_help(calc) is False
+    mock_print.assert_called_once_with(HELP_TEXT)
+
+
+@patch('builtins.print')
+def test_handle_exit_saves(mock_print, calc):
+    """Test that exit saves history and stops the REPL."""
+    assert _handle_exit(calc) is True
+    calc.save_history.assert_called_once_with()
+    mock_print.assert_any_call("History saved successfully.")
+    mock_print.assert_any_call("Goodbye!")
+
+
+@patch('builtins.print')
+def test_handle_exit_save_failure(mock_print, calc):
+    """Test that exit still stops the REPL when saving fails."""
+    calc.save_history.side_effect = OperationError("disk full")
+    assert _handle_exit(calc) is True
+    mock_print.assert_any_call("Warning: Could not save history: disk full")
+    mock_print.assert_any_call("Goodbye!")
+
+
+@patch('builtins.print')
+def test_handle_history_empty(mock_print, calc):
+    """Test the history command with no calculations."""
+    calc.show_history.return_value = []
+    assert _handle_history(calc) is False
+    mock_print.assert_called_once_with("No calculations in history")
+
+
+@patch('builtins.print')
+def test_handle_history_entries(mock_print, calc):
+    """Test that history prints numbered entries."""
+    calc.show_history.return_value = ["Addition(2, 3) = 5", "Subtraction(5, 1) = 4"]
+    assert _handle_history(calc) is False
+    mock_print.assert_any_call("\nCalculation History:")
+    mock_print.assert_any_call("1. Addition(2, 3) = 5")
+    mock_print.assert_any_call("2. Subtraction(5, 1) = 4")
+
+
+@patch('builtins.print')
+def test_handle_clear(mock_print, calc):
+    """Test that clear empties the history."""
+    assert _handle_clear(calc) is False
+    calc.clear_history.assert_called_once_with()
+    mock_print.assert_called_once_with("History cleared")
+
+
+@pytest.mark.parametrize("succeeded, message", [(True, "Operation undone"), (False, "Nothing to undo")])
+@patch('builtins.print')
+def test_handle_undo(mock_print, succeeded, message, calc):
+    """Test the undo command messages."""
+    calc.undo.return_value = succeeded
+    assert _handle_undo(calc) is False
+    mock_print.assert_called_once_with(message)
+
+
+@pytest.mark.parametrize("succeeded, message", [(True, "Operation redone"), (False, "Nothing to redo")])
+@patch('builtins.print')
+def test_handle_redo(mock_print, succeeded, message, calc):
+    """Test the redo command messages."""
+    calc.redo.return_value = succeeded
+    assert _handle_redo(calc) is False
+    mock_print.assert_called_once_with(message)
+
+
+@patch('builtins.print')
+def test_handle_save(mock_print, calc):
+    """Test a successful save."""
+    assert _handle_save(calc) is False
+    calc.save_history.assert_called_once_with()
+    mock_print.assert_called_once_with("History saved successfully")
+
+
+@patch('builtins.print')
+def test_handle_save_failure(mock_print, calc):
+    """Test that a failed save is reported."""
+    calc.save_history.side_effect = OperationError("disk full")
+    assert _handle_save(calc) is False
+    mock_print.assert_called_once_with("Error saving history: disk full")
+
+
+@patch('builtins.print')
+def test_handle_load(mock_print, calc):
+    """Test a successful load."""
+    assert _handle_load(calc) is False
+    calc.load_history.assert_called_once_with()
+    mock_print.assert_called_once_with("History loaded successfully")
+
+
+@patch('builtins.print')
+def test_handle_load_failure(mock_print, calc):
+    """Test that a failed load is reported."""
+    calc.load_history.side_effect = OperationError("bad file")
+    assert _handle_load(calc) is False
+    mock_print.assert_called_once_with("Error loading history: bad file")
+
+
+@patch('builtins.input', side_effect=['2', '3'])
+@patch('builtins.print')
+def test_handle_operation(mock_print, mock_input, calc):
+    """Test that an operation prints its normalized result."""
+    calc.perform_operation.return_value = Decimal('5.00')
+    assert _handle_operation('add', calc) is False
+    calc.set_operation.assert_called_once()
+    calc.perform_operation.assert_called_once_with('2', '3')
+    mock_print.assert_any_call("\nResult: 5")
+
+
+@pytest.mark.parametrize("inputs", [['cancel'], ['2', 'CANCEL']])
+@patch('builtins.print')
+def test_handle_operation_cancel(mock_print, inputs, calc):
+    """Test 'cancel' at either operand prompt."""
+    with patch('builtins.input', side_effect=inputs):
+        assert _handle_operation('add', calc) is False
+    calc.perform_operation.assert_not_called()
+    mock_print.assert_any_call("Operation cancelled")
+
+
+@pytest.mark.parametrize("error", [ValidationError("Invalid number format: x"), OperationError("Operation failed")])
+@patch('builtins.input', side_effect=['x', '3'])
+@patch('builtins.print')
+def test_handle_operation_known_error(mock_print, mock_input, error, calc):
+    """Test that validation and operation errors are reported."""
+    calc.perform_operation.side_effect = error
+    assert _handle_operation('add', calc) is False
+    mock_print.assert_any_call(f"Error: {error}")
+
+
+@patch('builtins.input', side_effect=['2', '3'])
+@patch('builtins.print')
+def test_handle_operation_unexpected_error(mock_print, mock_input, calc):
+    """Test that unexpected errors are reported."""
+    calc.perform_operation.side_effect = RuntimeError("boom")
+    assert _handle_operation('add', calc) is False
+    mock_print.assert_any_call("Unexpected error: boom")
@@ -64,6 +64,11 @@ def test_invalid_max_history_size():
         config = CalculatorConfig(max_history_size=-1)
         config.validate()
 
+def test_invalid_autosave_batch_size():
+    with pytest.raises(ConfigurationError, match="autosave_batch_size must be positive"):
+        config = CalculatorConfig(autosave_batch_size=-1)
+        config.validate()
+
 def test_invalid_precision():
     with pytest.raises(ConfigurationError, match="precision must be positive"):
         config = CalculatorConfig(precision=-1)
@@ -106,11 +111,13 @@ def test_default_fallbacks():
     # Clear all related environment variables and test default values
     clear_env_vars(
         'CALCULATOR_MAX_HISTORY_SIZE', 'CALCULATOR_AUTO_SAVE', 'CALCULATOR_PRECISION',
-        'CALCULATOR_MAX_INPUT_VALUE', 'CALCULATOR_DEFAULT_ENCODING'
+        'CALCULATOR_MAX_INPUT_VALUE', 'CALCULATOR_DEFAULT_ENCODING',
+        'CALCULATOR_AUTOSAVE_BATCH_SIZE'
     )
     config = CalculatorConfig()
     assert config.max_history_size == 1000
     assert config.auto_save is True
+    assert config.autosave_batch_size == 50
     assert config.precision == 10
     assert config.max_input_value == Decimal("1e999")
     assert config.default_encoding == 'utf-8'
@@ -144,3 +151,8 @@ def test_history_file_property():
     config = CalculatorConfig(base_dir=Path('/new_base_dir'))
     assert config.history_file == Path('/new_base_dir/history/calculator_history.csv').resolve()
 
+
+def test_path_properties_are_cached():
+    clear_env_vars('CALCULATOR_HISTORY_DIR', 'CALCULATOR_HISTORY_FILE')
+    config = CalculatorConfig(base_dir=Path('/new_base_dir'))
+    assert config.history_file is config.history_file
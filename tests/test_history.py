@@ -4,6 +4,7 @@ from app.calculation import Calculation
 from app.history import LoggingObserver, AutoSaveObserver
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
+from app.operations import OperationFactory
 
 # Sample setup for mock calculation
 calculation_mock = Mock(spec=Calculation)
@@ -33,6 +34,9 @@ def test_autosave_observer_triggers_save():
     calculator_mock = Mock(spec=Calculator)
     calculator_mock.config = Mock(spec=CalculatorConfig)
     calculator_mock.config.auto_save = True
+    calculator_mock.config.autosave_batch_size = 1
+    calculator_mock.history_version = 1
+    calculator_mock.saved_version = 0
     observer = AutoSaveObserver(calculator_mock)
     
     observer.update(calculation_mock)
@@ -43,11 +47,90 @@ def test_autosave_observer_logs_autosave(logging_info_mock):
     calculator_mock = Mock(spec=Calculator)
     calculator_mock.config = Mock(spec=CalculatorConfig)
     calculator_mock.config.auto_save = True
+    calculator_mock.config.autosave_batch_size = 1
+    calculator_mock.history_version = 1
+    calculator_mock.saved_version = 0
     observer = AutoSaveObserver(calculator_mock)
     
     observer.update(calculation_mock)
     logging_info_mock.assert_called_once_with("History auto-saved")
 
+@pytest.fixture
+def calculator(tmp_path, clear_path_env):
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=True, autosave_batch_size=3)
+    with patch.object(Calculator, 'load_history'):
+        calc = Calculator(config)
+    calc.set_operation(OperationFactory.create_operation('add'))
+    return calc
+
+def test_autosave_observer_batches_saves(calculator):
+    observer = AutoSaveObserver(calculator)
+    calculator.add_observer(observer)
+
+    with patch.object(calculator, 'save_history', wraps=calculator.save_history) as mock_save:
+        for i in range(7):
+            calculator.perform_operation(i, 1)
+        assert mock_save.call_count == 2
+        mock_save.assert_called_with(background=True)
+        assert observer.pending == 1
+
+        # Flushing writes the remaining calculation exactly once, in the foreground
+        observer.flush()
+        observer.flush()
+        assert mock_save.call_count == 3
+        mock_save.assert_called_with()
+    assert observer.pending == 0
+    assert not calculator.has_unsaved_changes
+    calculator.remove_observer(observer)
+
+def test_autosave_observer_flush_skips_after_explicit_save(calculator):
+    observer = AutoSaveObserver(calculator)
+    calculator.add_observer(observer)
+    calculator.perform_operation(2, 3)
+    assert observer.pending == 1
+
+    # An explicit save (e.g. the REPL's exit command) leaves nothing to flush
+    calculator.save_history()
+    assert observer.pending == 0
+    with patch.object(calculator, 'save_history') as mock_save:
+        observer.flush()
+    mock_save.assert_not_called()
+    calculator.remove_observer(observer)
+
+def test_autosave_observer_flush_recovers_failed_background_save(calculator):
+    observer = AutoSaveObserver(calculator)
+    calculator.add_observer(observer)
+    with patch('app.calculator._write_history_file', side_effect=OSError("disk full")):
+        for i in range(3):
+            calculator.perform_operation(i, 1)
+        calculator.wait_for_pending_save()
+    assert calculator.has_unsaved_changes
+
+    # The atexit flush still writes the batch whose background write failed
+    observer.flush()
+    assert not calculator.has_unsaved_changes
+    assert calculator.config.history_file.exists()
+    calculator.remove_observer(observer)
+
+@patch('logging.error')
+def test_autosave_observer_flush_logs_failure(logging_error_mock, calculator):
+    observer = AutoSaveObserver(calculator)
+    calculator.add_observer(observer)
+    calculator.perform_operation(2, 3)
+
+    with patch.object(calculator, 'save_history', side_effect=Exception("disk full")):
+        observer.flush()
+    logging_error_mock.assert_called_once_with("Failed to flush auto-saved history: disk full")
+    calculator.remove_observer(observer)
+
+@patch('app.history.atexit')
+def test_remove_observer_unregisters_atexit_flush(mock_atexit, calculator):
+    observer = AutoSaveObserver(calculator)
+    mock_atexit.register.assert_called_once_with(observer.flush)
+    calculator.add_observer(observer)
+    calculator.remove_observer(observer)
+    mock_atexit.unregister.assert_called_once_with(observer.flush)
+
 def test_autosave_observer_does_not_trigger_save_when_disabled():
     calculator_mock = Mock(spec=Calculator)
     calculator_mock.config = Mock(spec=CalculatorConfig)
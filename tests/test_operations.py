@@ -145,6 +145,9 @@ class TestPower(BaseOperationTest):
         "one_exponent": {"a": "5", "b": "1", "expected": "5"},
         "decimal_base": {"a": "2.5", "b": "2", "expected": "6.25"},
         "zero_base": {"a": "0", "b": "5", "expected": "0"},
+        "zero_to_zero": {"a": "0", "b": "0", "expected": "1"},
+        "exact_decimal_base": {"a": "1.1", "b": "2", "expected": "1.21"},
+        "fractional_exponent": {"a": "4", "b": "0.5", "expected": "2"},
     }
     invalid_test_cases = {
         "negative_exponent": {
@@ -218,6 +221,22 @@ class TestOperationFactory:
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
 
+    def test_create_operation_is_cached(self):
+        """Test repeated creation returns the shared operation instance."""
+        first = OperationFactory.create_operation('add')
+        assert OperationFactory.create_operation('add') is first
+
+    def test_register_operation_clears_cache(self):
+        """Test re-registering a name replaces the cached instance."""
+        class ReplacementOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b
+
+        OperationFactory.register_operation("replaceable", Addition)
+        assert isinstance(OperationFactory.create_operation("replaceable"), Addition)
+        OperationFactory.register_operation("replaceable", ReplacementOperation)
+        assert isinstance(OperationFactory.create_operation("replaceable"), ReplacementOperation)
+
     def test_register_invalid_operation(self):
         """Test registering an invalid operation class raises error."""
         class InvalidOperation:
@@ -71,3 +71,18 @@ def test_validate_number_none_value():
 def test_validate_number_non_numeric_type():
     with pytest.raises(ValidationError, match="Invalid number format: "):
         InputValidator.validate_number([], config)
+
+def test_validate_number_scientific_notation_string():
+    assert InputValidator.validate_number("1.5e3", config) == Decimal('1500')
+
+def test_validate_number_signed_and_bare_decimal_strings():
+    assert InputValidator.validate_number("+5", config) == Decimal('5')
+    assert InputValidator.validate_number(".5", config) == Decimal('0.5')
+
+def test_validate_number_rejects_non_finite_string():
+    with pytest.raises(ValidationError, match="Invalid number format: NaN"):
+        InputValidator.validate_number("NaN", config)
+
+def test_validate_number_rejects_decimal_nan():
+    with pytest.raises(ValidationError, match="Invalid number format: NaN"):
+        InputValidator.validate_number(Decimal('NaN'), config)